@@ -1,6 +1,8 @@
 """API for Electrolux Status."""
 
 import copy
+from dataclasses import dataclass
+from functools import lru_cache
 import logging
 import re
 from typing import Any
@@ -22,7 +24,6 @@ from .const import (
     BUTTON,
     ATTRIBUTES_BLACKLIST,
     NUMBER,
-    PLATFORMS,
     RENAME_RULES,
     SELECT,
     SENSOR,
@@ -40,6 +41,107 @@ _LOGGER: logging.Logger = logging.getLogger(__package__)
 
 HEADERS = {"Content-type": "application/json; charset=UTF-8"}
 
+# Entity class to instantiate for each platform
+_ENTITY_CLASSES: dict[Platform, type[ElectroluxEntity]] = {
+    BINARY_SENSOR: ElectroluxBinarySensor,
+    BUTTON: ElectroluxButton,
+    NUMBER: ElectroluxNumber,
+    SELECT: ElectroluxSelect,
+    SENSOR: ElectroluxSensor,
+    SWITCH: ElectroluxSwitch,
+}
+
+# Precompiled naming patterns, these are evaluated for every capability
+_RENAME_PATTERNS = [re.compile(rule) for rule in RENAME_RULES]
+_BLACKLIST_MATCHES = [re.compile(pattern).match for pattern in ATTRIBUTES_BLACKLIST]
+_WHITELIST_MATCHES = [re.compile(pattern).match for pattern in ATTRIBUTES_WHITELIST]
+
+
+def _split_words(name: str) -> list[str]:
+    """Split a space separated camelCase name into words.
+
+    A new word starts on a space or on an uppercase letter / digit following
+    a lowercase letter. The case of the words is preserved.
+    """
+    words: list[str] = []
+    group: list[str] = []
+    prev_lower = False
+    for char in name:
+        if not group:
+            group.append(char)
+        elif char == " ":
+            words.append("".join(group))
+            group = []
+        elif prev_lower and (char.isupper() or char.isdigit()):
+            words.append("".join(group))
+            group = [char]
+        else:
+            group.append(char)
+        prev_lower = char.islower()
+    if group:
+        words.append("".join(group))
+    return words
+
+
+def _split_sensor_name(attr_name: str) -> str:
+    """Convert a capability name to a human readable sensor name.
+
+    ex: "userSelections/analogTemperature" to "analog temperature".
+    """
+    sensor = attr_name
+    for truncate_pattern in _RENAME_PATTERNS:
+        sensor = truncate_pattern.sub("", sensor)
+    sensor = sensor[0].upper() + sensor[1:]
+    sensor = sensor.replace("_", " ")
+    sensor = sensor.replace("/", " ")
+    # The whole name is lowercased so the words do not need to be re-cased
+    return " ".join(_split_words(sensor)).lower()
+
+
+# Sensor names of the known catalog entries are computed once at import,
+# names of other capabilities are added on first use
+_SENSOR_NAME_CACHE: dict[str, str] = {
+    key: _split_sensor_name(key)
+    for catalog in (CATALOG_BASE, *CATALOG_MODEL.values())
+    for key in catalog
+}
+
+
+def _sensor_name(attr_name: str) -> str:
+    """Return the cached sensor name of a capability."""
+    if (name := _SENSOR_NAME_CACHE.get(attr_name)) is None:
+        name = _SENSOR_NAME_CACHE[attr_name] = _split_sensor_name(attr_name)
+    return name
+
+
+@lru_cache(maxsize=2048)
+def _split_capability(attr_name: str) -> tuple[str, str]:
+    """Split a capability name into its category and raw attribute.
+
+    ex: "fCMiscellaneousState/detergentExtradosage" to ("fCMiscellaneousState", "detergentExtradosage").
+    """
+    category, _, attr = attr_name.rpartition("/")
+    return category, attr or attr_name
+
+
+@lru_cache(maxsize=2048)
+def _entity_name(attr_name: str) -> str:
+    """Convert a capability name to the entity name with RENAME_RULES applied."""
+    for truncate_pattern in _RENAME_PATTERNS:
+        attr_name = truncate_pattern.sub("", attr_name)
+
+    return _split_capability(attr_name)[1]
+
+
+@dataclass(slots=True)
+class _ResolvedCapability:
+    """Entity properties derived from a capability definition."""
+
+    capability: dict[str, Any] | None
+    entity_type: Platform | None = None
+    unit: str | None = None
+    device_class: NumberDeviceClass | SensorDeviceClass | None = None
+
 
 class ElectroluxLibraryEntity:
     """Electrolux Library Entity."""
@@ -58,11 +160,15 @@ class ElectroluxLibraryEntity:
         self.state = state
         self.appliance_info = appliance_info
         self.capabilities = capabilities
+        self._reported_state: dict[str, Any] | None = None
+        self._resolved_capabilities: dict[str, _ResolvedCapability] = {}
 
     @property
     def reported_state(self) -> dict[str, Any]:
         """Return the reported state of the appliance."""
-        return self.state.get("properties", {}).get("reported")
+        if self._reported_state is None:
+            self._reported_state = self.state.get("properties", {}).get("reported")
+        return self._reported_state
 
     def get_name(self):
         """Get entity name."""
@@ -77,46 +183,7 @@ class ElectroluxLibraryEntity:
 
     def get_sensor_name(self, attr_name: str) -> str:
         """Get the name of the sensor."""
-        sensor = attr_name
-        for truncate_rule in RENAME_RULES:
-            sensor = re.sub(truncate_rule, "", sensor)
-        sensor = sensor[0].upper() + sensor[1:]
-        sensor = sensor.replace("_", " ")
-        sensor = sensor.replace("/", " ")
-        group = ""
-        words = []
-        for i, char in enumerate(sensor):
-            if group == "":
-                group = char
-            else:
-                if char == " " and len(group) > 0:
-                    words.append(group)
-                    group = ""
-                    continue
-
-                if (
-                    (char.isupper() or char.isdigit())
-                    and (sensor[i - 1].isupper() or sensor[i - 1].isdigit())
-                    and (
-                        (i == len(sensor) - 1)
-                        or (sensor[i + 1].isupper() or sensor[i + 1].isdigit())
-                    )
-                ):
-                    group += char
-                elif (char.isupper() or char.isdigit()) and sensor[i - 1].islower():
-                    if re.match("^[A-Z0-9]+$", group):
-                        words.append(group)
-                    else:
-                        words.append(group.lower())
-                    group = char
-                else:
-                    group += char
-        if len(group) > 0:
-            if re.match("^[A-Z0-9]+$", group):
-                words.append(group)
-            else:
-                words.append(group.lower())
-        return " ".join(words).lower()
+        return _sensor_name(attr_name)
 
     # def get_sensor_name_old(self, attr_name: str, container: str | None = None):
     #     """Convert sensor format.
@@ -133,17 +200,14 @@ class ElectroluxLibraryEntity:
 
         ex: Convert format "fCMiscellaneousState/EWX1493A_detergentExtradosage" to "XdetergentExtradosage"
         """
-        for truncate_rule in RENAME_RULES:
-            attr_name = re.sub(truncate_rule, "", attr_name)
-
-        return attr_name.rpartition("/")[-1] or attr_name
+        return _entity_name(attr_name)
 
     def get_entity_attr(self, attr_name: str) -> str:
         """Extract Entity attr in raw format.
 
         ex: Convert format "fCMiscellaneousState/EWX1493A_detergentExtradosage" to "EWX1493A_detergentExtradosage"
         """
-        return attr_name.rpartition("/")[-1] or attr_name
+        return _split_capability(attr_name)[1]
 
     def get_category(self, attr_name: str) -> str:
         """Extract category.
@@ -151,7 +215,7 @@ class ElectroluxLibraryEntity:
         ex: "fCMiscellaneousState/detergentExtradosage" to "fCMiscellaneousState".
         or "" if none
         """
-        return attr_name.rpartition("/")[0]
+        return _split_capability(attr_name)[0]
 
     def get_capability(self, attr_name: str) -> dict[str, Any] | None:
         """Retrieve the capability from self.capabilities using the attribute name.
@@ -173,61 +237,84 @@ class ElectroluxLibraryEntity:
 
         return result
 
+    def set_capability(self, attr_name: str, capability_info: dict[str, Any]) -> None:
+        """Store the capability definition in self.capabilities.
+
+        May contain slashes for nested keys.
+        """
+        keys = attr_name.split("/")
+        capabilities = self.capabilities
+        for key in keys[:-1]:
+            capabilities = capabilities.setdefault(key, {})
+        capabilities[keys[-1]] = capability_info
+        self._resolved_capabilities.pop(attr_name, None)
+
     def get_entity_unit(self, attr_name: str):
         """Get entity unit type."""
-        capability_def: dict[str, Any] | None = self.get_capability(attr_name)
-        if not capability_def:
-            return None
-        # Type : string, int, number, boolean (other values ignored)
-        type_units = capability_def.get("type", None)
-        if not type_units:
-            return None
-        if type_units == "temperature":
-            return UnitOfTemperature.CELSIUS
-        return None
+        return self.resolve_capability(attr_name).unit
 
     def get_entity_device_class(self, attr_name: str):
         """Get entity device class."""
-        capability_def: dict[str, Any] | None = self.get_capability(attr_name)
-        if not capability_def:
-            return None
-        # Type : string, int, number, boolean (other values ignored)
-        type_class = capability_def.get("type", None)
-        if not type_class:
-            return None
-        if type_class == "temperature":
-            if capability_def.get("access", None) == "readwrite":
-                return NumberDeviceClass.TEMPERATURE
-            return SensorDeviceClass.TEMPERATURE
-        return None
+        return self.resolve_capability(attr_name).device_class
 
     def get_entity_type(self, attr_name: str) -> Platform | None:
         """Get entity type."""
+        return self.resolve_capability(attr_name).entity_type
 
+    def resolve_capability(self, attr_name: str) -> _ResolvedCapability:
+        """Return the capability and the entity properties derived from it."""
+        if (resolved := self._resolved_capabilities.get(attr_name)) is None:
+            resolved = self._resolve_capability(attr_name)
+            self._resolved_capabilities[attr_name] = resolved
+        return resolved
+
+    def _resolve_capability(self, attr_name: str) -> _ResolvedCapability:
+        """Determine unit, device class and entity type in a single pass."""
         capability_def: dict[str, Any] | None = self.get_capability(attr_name)
+        resolved = _ResolvedCapability(capability=capability_def)
         if not capability_def:
-            return None
+            return resolved
 
         # Type : string, int, number, boolean (other values ignored)
         type_object = capability_def.get("type", None)
         if not type_object:
-            return None
+            return resolved
 
         # Access : read, readwrite (other values ignored)
         access = capability_def.get("access", None)
-        if not access:
-            return None
+
+        if type_object == "temperature":
+            resolved.unit = UnitOfTemperature.CELSIUS
+            if access == "readwrite":
+                resolved.device_class = NumberDeviceClass.TEMPERATURE
+            else:
+                resolved.device_class = SensorDeviceClass.TEMPERATURE
+
+        if access:
+            resolved.entity_type = self._entity_type(
+                attr_name, capability_def, type_object, access
+            )
+        return resolved
+
+    def _entity_type(
+        self,
+        attr_name: str,
+        capability_def: dict[str, Any],
+        type_object: str,
+        access: str,
+    ) -> Platform | None:
+        """Determine the entity type from the capability type and access."""
+        values: dict[str, Any] | None = capability_def.get("values", None)
 
         # Exception (Electrolux bug)
         if (
             type_object == "boolean"
             and access == "readwrite"
-            and capability_def.get("values", None) is not None
+            and values is not None
         ):
             return SWITCH
 
         # List of values ? if values is defined and has at least 1 entry
-        values: dict[str, Any] | None = capability_def.get("values", None)
         if (
             values
             and access == "readwrite"
@@ -291,25 +378,21 @@ class ElectroluxLibraryEntity:
         # one or another are useful, but not all child values are
 
         def keep_source(source: str) -> bool:
-            for ignored_pattern in ATTRIBUTES_BLACKLIST:
-                if re.match(ignored_pattern, source):
-                    for whitelist_pattern in ATTRIBUTES_WHITELIST:
-                        if re.match(whitelist_pattern, source):
+            for ignored_match in _BLACKLIST_MATCHES:
+                if ignored_match(source):
+                    for whitelist_match in _WHITELIST_MATCHES:
+                        if whitelist_match(source):
                             return True
                     _LOGGER.debug("Exclude source %s from list", source)
                     return False
             return True
 
-        sources = [
-            key
-            for key in list(self.capabilities.keys())
-            if keep_source(key)
+        kept = [
+            (key, value) for key, value in self.capabilities.items() if keep_source(key)
         ]
+        sources = [key for key, _ in kept]
 
-        for key, value in self.capabilities.items():
-            if not keep_source(key):
-                continue
-
+        for key, value in kept:
             if isinstance(value, dict):
                 for sub_key, sub_value in value.items():
                     if (
@@ -338,6 +421,7 @@ class Appliance:
     brand: str
     device: str
     entities: list[ElectroluxEntity]
+    entities_by_type: dict[Platform | str, list[ElectroluxEntity]]
     coordinator: Any
 
     def __init__(
@@ -358,11 +442,24 @@ class Appliance:
         self.name = name
         self.brand = brand
         self.state: ApplienceStatusResponse = state
+        self._reported_state: dict[str, Any] | None = None
+        self._catalog: dict[str, ElectroluxDevice] | None = None
+        self._catalog_index: (
+            dict[tuple[str, str], tuple[str, ElectroluxDevice]] | None
+        ) = None
+        self._entity_index: dict[tuple[str, str], ElectroluxEntity] = {}
 
     @property
     def reported_state(self) -> dict[str, Any]:
-        """Return the reported state of the appliance."""
-        return self.state.get("properties", {}).get("reported", {})
+        """Return the reported state of the appliance.
+
+        Resolved once per state, update() resets it when the state is replaced.
+        """
+        if self._reported_state is None:
+            self._reported_state = self.state.get("properties", {}).get(
+                "reported", {}
+            )
+        return self._reported_state
 
     @property
     def appliance_type(self) -> dict[str, Any]:
@@ -378,6 +475,12 @@ class Appliance:
     @property
     def catalog(self) -> dict[str, ElectroluxDevice]:
         """Return the defined catalog for the appliance."""
+        if self._catalog is None:
+            self._catalog = self._build_catalog()
+        return self._catalog
+
+    def _build_catalog(self) -> dict[str, ElectroluxDevice]:
+        """Build the catalog for the appliance model."""
         # TODO: Use appliance_type as opposed to model?
         if self.model in CATALOG_MODEL:
             _LOGGER.debug("Extending catalog for %s", self.model)
@@ -394,38 +497,55 @@ class Appliance:
             return new_catalog
         return CATALOG_BASE
 
+    @property
+    def catalog_index(self) -> dict[tuple[str, str], tuple[str, ElectroluxDevice]]:
+        """Return the catalog entries indexed by (category, attribute)."""
+        if self._catalog_index is None:
+            index: dict[tuple[str, str], tuple[str, ElectroluxDevice]] = {}
+            for key, catalog_item in self.catalog.items():
+                index[_split_capability(key)] = (key, catalog_item)
+            self._catalog_index = index
+        return self._catalog_index
+
     def update_missing_entities(self) -> None:
         """Add missing entities when no capabilities returned by the API.
 
         This is done dynamically but only when the reported state contains the attributes.
         """
-        if not self.own_capabilties or not self.reported_state:
+        reported_state = self.reported_state
+        if not self.own_capabilties or not reported_state:
             return
 
-        for key, catalog_item in self.catalog.items():
-            category = self.data.get_category(key)
-            if (
-                category
-                and self.reported_state.get(category, None)
-                and self.reported_state.get(category, None).get(key)
-            ) or (not category and self.reported_state.get(key, None)):
-                found: bool = False
-                for entity in self.entities:
-                    if entity.entity_attr == key and entity.entity_source == category:
-                        found = True
-                        keys = key.split("/")
-                        capabilities = self.data.capabilities
-                        for key in keys[:-1]:
-                            capabilities = capabilities.setdefault(key, {})
-                        capabilities[keys[-1]] = catalog_item.capability_info
-                        break
-                if not found:
-                    _LOGGER.debug(
-                        "Electrolux discovered new entity from extracted data. Key: %s",
-                        key,
-                    )
-                    if entity := self.get_entity(key):
-                        self.entities.extend(entity)
+        # Only the reported attributes are looked up in the catalog
+        catalog_index = self.catalog_index
+        for category, reported in reported_state.items():
+            reported_attributes = [("", category)] if reported else []
+            if isinstance(reported, dict):
+                reported_attributes.extend(
+                    (category, attr) for attr, value in reported.items() if value
+                )
+            for source_attr in reported_attributes:
+                if (entry := catalog_index.get(source_attr)) is None:
+                    continue
+                key, catalog_item = entry
+                if source_attr in self._entity_index:
+                    self.data.set_capability(key, catalog_item.capability_info)
+                    continue
+                _LOGGER.debug(
+                    "Electrolux discovered new entity from extracted data. Key: %s",
+                    key,
+                )
+                if entity := self.get_entity(key, catalog_item):
+                    self._add_entities(entity)
+
+    def _add_entities(self, entities: list[ElectroluxEntity]) -> None:
+        """Append entities to the appliance and index them by type and attribute."""
+        self.entities.extend(entities)
+        for entity in entities:
+            self.entities_by_type.setdefault(entity.entity_type, []).append(entity)
+            self._entity_index.setdefault(
+                (entity.entity_source, entity.entity_attr), entity
+            )
 
     def get_state(self, attr_name: str) -> dict[str, Any] | None:
         """Retrieve the start from self.reported_state using the attribute name.
@@ -443,21 +563,28 @@ class Appliance:
 
         return result
 
-    def get_entity(self, capability: str) -> list[ElectroluxEntity] | None:
-        """Return the entity."""
-        entity_type = self.data.get_entity_type(capability)
-        entity_name = self.data.get_entity_name(capability)
-        entity_attr = self.data.get_entity_attr(capability)
-        category = self.data.get_category(capability)
-        capability_info = self.data.get_capability(capability)
-        device_class = self.data.get_entity_device_class(capability)
+    def get_entity(
+        self, capability: str, catalog_item: ElectroluxDevice | None = None
+    ) -> list[ElectroluxEntity] | None:
+        """Return the entity.
+
+        catalog_item can be passed when the caller already looked it up.
+        """
+        data = self.data
+        resolved = data.resolve_capability(capability)
+        entity_type = resolved.entity_type
+        entity_name = data.get_entity_name(capability)
+        category, entity_attr = _split_capability(capability)
+        capability_info = resolved.capability
+        device_class = resolved.device_class
         entity_category = None
         entity_icon = None
-        unit = self.data.get_entity_unit(capability)
-        display_name = f"{self.data.get_name()} {self.data.get_sensor_name(capability)}"
+        unit = resolved.unit
+        display_name = f"{data.name} {data.get_sensor_name(capability)}"
 
         # get the item definition from the catalog
-        catalog_item = self.catalog.get(capability, None)
+        if catalog_item is None:
+            catalog_item = self.catalog.get(capability, None)
         if catalog_item:
             if capability_info is None:
                 capability_info = catalog_item.capability_info
@@ -500,109 +627,54 @@ class Appliance:
             catalog_item,
         )
 
-        def electrolux_entity_factory(
-            name: str,
-            entity_type: Platform | None,
-            entity_name: str,
-            entity_attr: str,
-            entity_source: str,
-            capability: str,
-            unit: str,
-            entity_category: str,
-            device_class: str,
-            icon: str,
-            catalog_entry: ElectroluxDevice | None,
-            commands: Any | None = None,
-        ):
-            entity_classes = {
-                BINARY_SENSOR: ElectroluxBinarySensor,
-                BUTTON: ElectroluxButton,
-                NUMBER: ElectroluxNumber,
-                SELECT: ElectroluxSelect,
-                SENSOR: ElectroluxSensor,
-                SWITCH: ElectroluxSwitch,
-            }
-
-            entity_class = entity_classes.get(entity_type)
-
-            if entity_class is None:
-                _LOGGER.debug("Unknown entity type %s for %s", entity_type, name)
-                raise ValueError(f"Unknown entity type: {entity_type}")
-
-            entity_params = {
-                "coordinator": self.coordinator,
-                "config_entry": self.coordinator.config_entry,
-                "pnc_id": self.pnc_id,
-                "name": name,
-                "entity_type": entity_type,
-                "entity_name": entity_name,
-                "entity_attr": entity_attr,
-                "entity_source": entity_source,
-                "capability": capability,
-                "unit": unit,
-                "entity_category": entity_category,
-                "device_class": device_class,
-                "icon": icon,
-                "catalog_entry": catalog_entry,
-            }
-
-            if commands is None:
-                return [entity_class(**entity_params)]
-
-            entities: list[
-                ElectroluxBinarySensor
-                | ElectroluxNumber
-                | ElectroluxSensor
-                | ElectroluxSwitch
-                | ElectroluxButton
-                | ElectroluxSelect
-            ] = []
-            # Replace entity name and icons for multi-entities attribute (one value = one entity)
-            for command in commands:
-                entity = {**entity_params, "val_to_send": command}
-                if catalog_item:
-                    if catalog_item.entity_value_named:
-                        entity["name"] = command
-                    if (
-                        catalog_item.entity_icons_value_map
-                        and catalog_item.entity_icons_value_map.get(command, None)
-                    ):
-                        entity["icon"] = catalog_item.entity_icons_value_map.get(
-                            command
-                        )
-                # Instanciate the new entity and append it
-                entities.append(entity_class(**entity))
-            return entities
-
-        if entity_type in PLATFORMS:
-            commands = (
-                capability_info.get("values", {}) if entity_type == BUTTON else None
-            )
-            return electrolux_entity_factory(
-                name=display_name,
-                entity_type=entity_type,
-                entity_name=entity_name,
-                entity_attr=entity_attr,
-                entity_source=category,
-                capability=capability_info,
-                unit=unit,
-                entity_category=entity_category,
-                device_class=device_class,
-                icon=entity_icon,
-                catalog_entry=catalog_item,
-                commands=commands,
-            )
+        if (entity_class := _ENTITY_CLASSES.get(entity_type)) is None:
+            return []
+
+        coordinator = self.coordinator
+        entity_params = {
+            "coordinator": coordinator,
+            "config_entry": coordinator.config_entry,
+            "pnc_id": self.pnc_id,
+            "name": display_name,
+            "entity_type": entity_type,
+            "entity_name": entity_name,
+            "entity_attr": entity_attr,
+            "entity_source": category,
+            "capability": capability_info,
+            "unit": unit,
+            "entity_category": entity_category,
+            "device_class": device_class,
+            "icon": entity_icon,
+            "catalog_entry": catalog_item,
+        }
+
+        if entity_type != BUTTON:
+            return [entity_class(**entity_params)]
 
-        return []
+        entities: list[ElectroluxEntity] = []
+        value_named = bool(catalog_item and catalog_item.entity_value_named)
+        icons_value_map = (catalog_item and catalog_item.entity_icons_value_map) or {}
+        # Replace entity name and icons for multi-entities attribute (one value = one entity)
+        for command in capability_info.get("values", {}):
+            entity = {**entity_params, "val_to_send": command}
+            if value_named:
+                entity["name"] = command
+            if icon := icons_value_map.get(command, None):
+                entity["icon"] = icon
+            # Instanciate the new entity and append it
+            entities.append(entity_class(**entity))
+        return entities
 
     def setup(self, data: ElectroluxLibraryEntity):
         """Configure the entity."""
         self.data: ElectroluxLibraryEntity = data
         self.entities: list[ElectroluxEntity] = []
+        self.entities_by_type = {}
+        self._entity_index = {}
         entities: list[ElectroluxEntity] = []
         # Extraction of the appliance capabilities & mapping to the known entities of the component
         # [ "applianceState", "autoDosing",..., "userSelections/analogTemperature",...]
-        capabilities_names = self.data.sources_list()
+        capabilities_names = data.sources_list()
 
         if capabilities_names is None and self.state:
             # No capabilities returned (unstable API)
@@ -613,37 +685,38 @@ class Appliance:
         # Add static attribute
         # these are attributes that are not in the capability entry
         # but are returned by the api independantly
+        reported_capabilities = set(capabilities_names or ())
         for static_attribute in STATIC_ATTRIBUTES:
             _LOGGER.debug("Electrolux static_attribute %s", static_attribute)
+            # attr already reported in capabilities, created below
+            if static_attribute in reported_capabilities:
+                continue
             # attr not found in state, next attr
             if self.get_state(static_attribute) is None:
                 continue
             if catalog_item := self.catalog.get(static_attribute, None):
-                if (entity := self.get_entity(static_attribute)) is None:
+                if (entity := self.get_entity(static_attribute, catalog_item)) is None:
                     # catalog definition and automatic checks fail to determine type
                     _LOGGER.debug(
                         "Electrolux static_attribute undefined %s", static_attribute
                     )
                     continue
                 # add to the capability dict
-                keys = static_attribute.split("/")
-                capabilities = self.data.capabilities
-                for key in keys[:-1]:
-                    capabilities = capabilities.setdefault(key, {})
-                capabilities[keys[-1]] = catalog_item.capability_info
+                data.set_capability(static_attribute, catalog_item.capability_info)
                 _LOGGER.debug("Electrolux adding static_attribute %s", static_attribute)
                 entities.extend(entity)
 
         # For each capability src
         if capabilities_names:
+            get_entity = self.get_entity
             for capability in capabilities_names:
-                if entity := self.get_entity(capability):
+                if entity := get_entity(capability):
                     entities.extend(entity)
                 else:
                     _LOGGER.debug("Could not create entity for capability %s", capability)
 
         # Setup each found entity
-        self.entities = entities
+        self._add_entities(entities)
         for entity in entities:
             entity.setup(data)
 
@@ -667,6 +740,7 @@ class Appliance:
     def update(self, appliance_status: ApplienceStatusResponse):
         """Update appliance status."""
         self.state = appliance_status
+        self._reported_state = None
         self.update_missing_entities()
         for entity in self.entities:
             entity.update(self.state)
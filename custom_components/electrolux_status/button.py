@@ -27,9 +27,7 @@ async def async_setup_entry(
     coordinator = hass.data[DOMAIN][entry.entry_id]
     if appliances := coordinator.data.get("appliances", None):
         for appliance_id, appliance in appliances.appliances.items():
-            entities = [
-                entity for entity in appliance.entities if entity.entity_type == BUTTON
-            ]
+            entities = appliance.entities_by_type.get(BUTTON, [])
             _LOGGER.debug(
                 "Electrolux add %d BUTTON entities to registry for appliance %s",
                 len(entities),
@@ -77,24 +75,20 @@ class ElectroluxButton(ElectroluxEntity, ButtonEntity):
             catalog_entry=catalog_entry,
         )
         self.val_to_send = val_to_send
+        self._unique_id = f"{config_entry.entry_id}-{val_to_send}-{entity_attr}-{entity_source}-{pnc_id}"
 
     @property
     def entity_domain(self):
         """Enitity domain for the entry. Used for consistent entity_id."""
         return BUTTON
 
-    @property
-    def unique_id(self) -> str:
-        """Return a unique ID to use for this entity."""
-        return f"{self.config_entry.entry_id}-{self.val_to_send}-{self.entity_attr}-{self.entity_source}-{self.pnc_id}"
-
     @property
     def name(self) -> str:
         """Return the name of the sensor."""
         name = self._name
         if self.catalog_entry and self.catalog_entry.friendly_name:
             name = (
-                f"{self.get_appliance.name} {self.catalog_entry.friendly_name.lower()}"
+                f"{self._appliance.name} {self.catalog_entry.friendly_name.lower()}"
             )
         # Get the last word from the 'name' variable
         # and compare to the command we are sending duplicate names
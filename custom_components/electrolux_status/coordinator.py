@@ -232,7 +232,8 @@ class ElectroluxCoordinator(DataUpdateCoordinator):
 
     def incoming_data(self, data: dict[str, dict[str, Any]]):
         """Process incoming data."""
-        _LOGGER.debug("Electrolux appliance state updated %s", json.dumps(data))
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Electrolux appliance state updated %s", json.dumps(data))
         # Update reported data
         appliances: Appliances = self.data.get("appliances", None)
         for appliance_id, appliance_data in data.items():
@@ -342,11 +343,12 @@ class ElectroluxCoordinator(DataUpdateCoordinator):
                 raise ConfigEntryNotReady(
                     "Electrolux unable to retrieve appliances list. Cancelling setup"
                 )
-            _LOGGER.debug(
-                "Electrolux get_appliances_list %s %s",
-                self.api,
-                json.dumps(appliances_list),
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Electrolux get_appliances_list %s %s",
+                    self.api,
+                    json.dumps(appliances_list),
+                )
 
             for appliance_json in appliances_list:
                 appliance_capabilities = None
@@ -358,23 +360,26 @@ class ElectroluxCoordinator(DataUpdateCoordinator):
                     "applianceName"
                 )
                 appliance_infos = await self.api.get_appliances_info([appliance_id])
-                _LOGGER.debug(
-                    "Electrolux get_appliances_info result: %s",
-                    json.dumps(appliance_infos),
-                )
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        "Electrolux get_appliances_info result: %s",
+                        json.dumps(appliance_infos),
+                    )
                 appliance_state = await self.api.get_appliance_state(appliance_id)
-                _LOGGER.debug(
-                    "Electrolux get_appliance_state result: %s",
-                    json.dumps(appliance_state),
-                )
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        "Electrolux get_appliance_state result: %s",
+                        json.dumps(appliance_state),
+                    )
                 try:
                     appliance_capabilities = await self.api.get_appliance_capabilities(
                         appliance_id
                     )
-                    _LOGGER.debug(
-                        "Electrolux get_appliance_capabilities result: %s",
-                        json.dumps(appliance_capabilities),
-                    )
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        _LOGGER.debug(
+                            "Electrolux get_appliance_capabilities result: %s",
+                            json.dumps(appliance_capabilities),
+                        )
                 except Exception as exception:  # noqa: BLE001
                     _LOGGER.warning(
                         "Electrolux unable to retrieve capabilities, we are going on our own",
@@ -1,7 +1,7 @@
 """Entity platform for Electrolux Status."""
 
 import logging
-from typing import Any, cast
+from typing import Any
 
 from pyelectroluxocp import OneAppApi
 from pyelectroluxocp.apiModels import ApplienceStatusResponse
@@ -27,11 +27,7 @@ async def async_setup_entry(
     coordinator = hass.data[DOMAIN][entry.entry_id]
     if appliances := coordinator.data.get("appliances", None):
         for appliance_id, appliance in appliances.appliances.items():
-            entities = [
-                entity
-                for entity in appliance.entities
-                if entity.entity_type == "entity"
-            ]
+            entities = appliance.entities_by_type.get("entity", [])
             _LOGGER.debug(
                 "Electrolux add %d entities to registry for appliance %s",
                 len(entities),
@@ -84,7 +80,21 @@ class ElectroluxEntity(CoordinatorEntity):
         self.pnc_id = pnc_id
         self.unit = unit
         self.capability = capability
-        self.entity_id = f"{self.entity_domain}.{self.get_appliance.brand}_{self.get_appliance.name}_{self.entity_source}_{self.entity_attr}"
+        # keys to walk to the entity value in the appliance status
+        self._value_path = (
+            (entity_source, entity_attr) if entity_source else (entity_attr,)
+        )
+        self._reported_value_path = (*self.root_attribute, *self._value_path)
+        # the appliance and its device info do not change for the entity lifetime
+        self._appliance = coordinator.data["appliances"].get_appliance(pnc_id)
+        self._device_info = {
+            "identifiers": {(DOMAIN, self._appliance.name)},
+            "name": self._appliance.name,
+            "model": self._appliance.model,
+            "manufacturer": self._appliance.brand,
+        }
+        self._unique_id = f"{config_entry.entry_id}-{entity_attr}-{entity_source or 'root'}-{pnc_id}"
+        self.entity_id = f"{self.entity_domain}.{self._appliance.brand}_{self._appliance.name}_{self.entity_source}_{self.entity_attr}"
         if catalog_entry:
             self.entity_registry_enabled_default = (
                 catalog_entry.entity_registry_enabled_default
@@ -103,7 +113,7 @@ class ElectroluxEntity(CoordinatorEntity):
     @property
     def unique_id(self) -> str:
         """Return a unique ID to use for this entity."""
-        return f"{self.config_entry.entry_id}-{self.entity_attr}-{self.entity_source or 'root'}-{self.pnc_id}"
+        return self._unique_id
 
     # Disabled this as this removes the value from display : there is no readonly property for entities
     # @property
@@ -126,8 +136,7 @@ class ElectroluxEntity(CoordinatorEntity):
         # _LOGGER.debug("Electrolux entity got data %s", self.coordinator.data)
         if self.coordinator.data is None:
             return
-        appliances = self.coordinator.data.get("appliances", None)
-        self.appliance_status = appliances.get_appliance(self.pnc_id).state
+        self.appliance_status = self._appliance.state
         self.async_write_ha_state()
 
     def get_connection_state(self) -> str | None:
@@ -158,7 +167,7 @@ class ElectroluxEntity(CoordinatorEntity):
         """Return the name of the sensor."""
         if self.catalog_entry and self.catalog_entry.friendly_name:
             return (
-                f"{self.get_appliance.name} {self.catalog_entry.friendly_name.lower()}"
+                f"{self._appliance.name} {self.catalog_entry.friendly_name.lower()}"
             )
         return self._name
 
@@ -174,17 +183,12 @@ class ElectroluxEntity(CoordinatorEntity):
     @property
     def get_appliance(self):
         """Return the appliance device."""
-        return self.coordinator.data["appliances"].get_appliance(self.pnc_id)
+        return self._appliance
 
     @property
     def device_info(self):
         """Return identifiers of the device."""
-        return {
-            "identifiers": {(DOMAIN, self.get_appliance.name)},
-            "name": self.get_appliance.name,
-            "model": self.get_appliance.model,
-            "manufacturer": self.get_appliance.brand,
-        }
+        return self._device_info
 
     @property
     def entity_category(self) -> EntityCategory | None:
@@ -198,28 +202,22 @@ class ElectroluxEntity(CoordinatorEntity):
 
     def extract_value(self):
         """Return the appliance attributes of the entity."""
-        root_attribute = self.root_attribute
-        attribute = self.entity_attr
-        if self.appliance_status:
-            root = cast(any, self.appliance_status)
-            # Format returned by push is slightly different from format returned by API : fields are at root level
-            # Let's check if we can find the fields at root first
-            if (
-                self.entity_source and root.get(self.entity_source, None) is not None
-            ) or root.get(attribute, None):
-                root_attribute = None
-            if root_attribute:
-                for item in root_attribute:
-                    if root:
-                        root = root.get(item, None)
-            if root:
-                if self.entity_source:
-                    category: dict[str, Any] | None = root.get(self.entity_source, None)
-                    if category:
-                        return category.get(attribute)
-                else:
-                    return root.get(attribute, None)
-        return None
+        value = self.appliance_status
+        if not value:
+            return None
+        # Format returned by push is slightly different from format returned by API : fields are at root level
+        # Let's check if we can find the fields at root first
+        if (
+            self.entity_source and value.get(self.entity_source, None) is not None
+        ) or value.get(self.entity_attr, None):
+            path = self._value_path
+        else:
+            path = self._reported_value_path
+        for key in path:
+            if not value:
+                return None
+            value = value.get(key)
+        return value
 
     def update(self, appliance_status: ApplienceStatusResponse):
         """Update the appliance status."""
@@ -28,9 +28,7 @@ async def async_setup_entry(
     coordinator = hass.data[DOMAIN][entry.entry_id]
     if appliances := coordinator.data.get("appliances", None):
         for appliance_id, appliance in appliances.appliances.items():
-            entities = [
-                entity for entity in appliance.entities if entity.entity_type == SELECT
-            ]
+            entities = appliance.entities_by_type.get(SELECT, [])
             _LOGGER.debug(
                 "Electrolux add %d SELECT entities to registry for appliance %s",
                 len(entities),